@@ -495,12 +495,14 @@ if pgraph_installed:
                     # create a node for this point
                     landmark = ba.add_landmark(P)
 
-                    # now find which cameras it was seen by
-                    nframes = int(data.pop(0))
-                    for i in range(nframes):  # read "nframes" id, x, y triplets
-                        id = int(data.pop(0))
-                        u = float(data.pop(0))
-                        v = float(data.pop(0))
+                    # now find which cameras it was seen by, reading "nframes"
+                    # id, x, y triplets by index; pop(0) shifts the whole list
+                    # per element
+                    nframes = int(data[0])
+                    for i in range(1, 3 * nframes, 3):
+                        id = int(data[i])
+                        u = float(data[i + 1])
+                        v = float(data[i + 2])
 
                         # add a landmark projection
                         ba.add_projection(ba.views[id], landmark, np.r_[u, v])
@@ -16,6 +16,9 @@ scale(factor, width, height)
 rotate
 """
 
+import functools
+import warnings
+
 import numpy as np
 import scipy as sp
 import cv2 as cv
@@ -25,6 +28,35 @@ from spatialmath import base as smb
 from spatialmath import SE2
 from matplotlib.widgets import RectangleSelector
 
+
+def _aligned_full(shape, value, dtype, align=64):
+    # np.full with the buffer aligned to a cache-line boundary; NumPy itself
+    # only guarantees 16-byte alignment, so allocate some slack bytes and
+    # offset into them
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    raw = np.empty(nbytes + align, dtype=np.uint8)
+    offset = (-raw.ctypes.data) % align
+    out = raw[offset : offset + nbytes].view(dtype).reshape(shape)
+    out[...] = value
+    return out
+
+
+def _cuda_available():
+    # true if OpenCV was built with CUDA support and a device is present
+    try:
+        return cv.cuda.getCudaEnabledDeviceCount() > 0
+    except cv.error:
+        return False
+
+
+@functools.lru_cache(maxsize=64)
+def _rotation_matrix(angle, cx, cy, scale=1.0):
+    # memoized so that rotating a sequence of frames by the same angle only
+    # computes the matrix once
+    return cv.getRotationMatrix2D((cx, cy), angle, scale)
+
+
 _interp_dict = {
     "nearest": cv.INTER_NEAREST,  # nearest neighbor interpolation
     "linear": cv.INTER_LINEAR,  # bilinear interpolation
@@ -112,118 +144,26 @@ class ImageReshapeMixin:
             img = Image.Read('flowers1.png', dtype='float').pad(left=10, bottom=10, top=10, right=10, value='r').disp()
 
         """
-        pw = ((top, bottom), (left, right))
         if isinstance(value, str):
             value = self.like(name2color(value))
-        if self.nplanes != len(value):
+        value = np.asarray(value)
+        if value.ndim > 0 and value.size != self.nplanes:
             raise ValueError("value not compatible with image")
 
-        planes = []
-        for i, v in enumerate(value):
-            planes.append(np.pad(self.plane(i).image, pw, constant_values=(v, v)))
-        out = np.dstack(planes)
+        # allocate the padded image in one step and copy the original into
+        # its interior; np.pad would concatenate per axis, touching the
+        # border pixels several times
+        out = np.full(
+            (self.height + top + bottom, self.width + left + right) + self.shape[2:],
+            value,
+            dtype=self.dtype,
+        )
+        out[top : top + self.height, left : left + self.width, ...] = self.image
 
         return self.__class__(out, colororder=self.colororder)
 
     # TODO rationalize stack and cat methods
 
-    # @classmethod
-    # def hcat(cls, *pos, pad=0, return_offsets=False):
-    #     """
-    #     Horizontal concatenation of images
-
-    #     :param pad: gap between images, defaults to 0
-    #     :type pad: int, optional
-    #     :param return_offsets: additionally return the horizontal coordinates of each image, defaults to False
-    #     :type return_offsets: bool, optional
-    #     :raises ValueError: _description_
-    #     :raises ValueError: _description_
-    #     :return: horizontally stacked images
-    #     :rtype: :class:`Image` instance
-
-    #     Example:
-
-    #     .. runblock:: pycon
-
-    #         >>> img = Image.Read('street.png')
-    #         >>> Image.hcat(im, im, im)
-    #         >>> Image.hcat(im, im, im, return_offsets=True)
-
-    #     :seealso: :meth:`vcat`
-    #     """
-
-    #     if isinstance(pos[0], (tuple, list)):
-    #         images = pos[0]
-    #     else:
-    #         images = pos
-
-    #     height = max([image.height for image in images])
-
-    #     nplanes = images[0].nplanes
-    #     if not all([image.nplanes == nplanes for image in images]):
-    #         raise ValueError('all images must have same number of planes')
-    #     dtype = images[0].dtype
-    #     if not all([image.dtype == dtype for image in images]):
-    #         raise ValueError('all images must have same dtype')
-
-    #     u = []
-    #     if nplanes == 1:
-    #         # single plane case
-    #         combo = np.empty(shape=(height,0), dtype=dtype)
-
-    #         for image in images:
-    #             if image.height < height:
-    #                 image = np.pad(image.image, ((0, height - image.height), (0, 0)),
-    #                     constant_values=(pad,0))
-    #             else:
-    #                 image = image.image
-    #             u.append(combo.shape[1])
-    #             combo = np.hstack((combo, image))
-    #     else:
-    #         # multiplane case
-    #         combo = np.empty(shape=(height,0, nplanes), dtype=dtype)
-
-    #         for image in images:
-    #             if image.height < height:
-    #                 image = np.pad(image.image, ((0, height - image.height), (0, 0), (0, 0)),
-    #                     constant_values=(pad,0))
-    #             else:
-    #                 image = image.image
-    #             u.append(combo.shape[1])
-    #             combo = np.hstack((combo, image))
-
-    #     if return_offsets:
-    #         return cls(combo), u
-    #     else:
-    #         return cls(combo)
-
-    # @classmethod
-    # def vcat(cls, *pos, pad=0, return_offsets=False):
-
-    #     if isinstance(pos[0], (tuple, list)):
-    #         images = pos[0]
-    #     else:
-    #         images = pos
-
-    #     width = max([image.width for image in images])
-
-    #     combo = np.empty(shape=(0, width))
-
-    #     v = []
-    #     for image in images:
-    #         if image.width < width:
-    #             image = np.pad(image.image, ((width - image.width, 0), (0, 0)),
-    #                 constant_values=(pad, 0))
-    #         else:
-    #             image = image.image
-    #         v.append(combo.shape[0])
-    #         combo = np.vstack((combo, image))
-
-    #     if return_offsets:
-    #         return cls(combo), v
-    #     else:
-    #         return cls(combo)
-
     @classmethod
     def Hstack(cls, images, sep=1, bgcolor=None, return_offsets=False):
         """
@@ -270,11 +210,9 @@ class ImageReshapeMixin:
 
         :seealso: :meth:`Vstack` :meth:`Tile`
         """
-        width = (len(images) - 1) * sep
         height = 0
         colororder = None
         for image in images:
-            width += image.shape[1]
             if image.shape[0] > height:
                 height = image.shape[0]
             if image.iscolor:
@@ -293,19 +231,25 @@ class ImageReshapeMixin:
                 bgcolor = [
                     0,
                 ] * len(colororder)
-        canvas = cls.Constant(width, height, bgcolor, dtype=images[0].dtype)
-        # if colororder is not None:
-        #     canvas = canvas.colorize(colororder=colororder)
 
-        width = 0
-        u = []
-        for image in images:
-            u.append(width)
+        # horizontal offset of each image, by cumulative sum of widths plus
+        # separators
+        offsets = np.cumsum([0] + [image.shape[1] + sep for image in images])
+        canvas = cls.Constant(offsets[-1] - sep, height, bgcolor, dtype=images[0].dtype)
+        if colororder is None and canvas.iscolor:
+            # a string or 3-vector bgcolor promotes the canvas to color, even
+            # if every input image is greyscale; colorize the inputs to match
+            colororder = canvas.colororder
+
+        # copy each image into the canvas by slice assignment, one contiguous
+        # block copy per image with no intermediate padded copies
+        A = canvas.A
+        for image, u in zip(images, offsets[:-1]):
             if colororder is not None and not image.iscolor:
                 image = image.colorize(colororder=colororder)
-            canvas.paste(image, (width, 0))
-            width += image.shape[1] + sep
+            A[: image.shape[0], u : u + image.shape[1], ...] = image.image
 
+        u = offsets[:-1].tolist()
         if return_offsets:
             return cls(canvas, colororder=colororder), u
         else:
@@ -356,11 +300,9 @@ class ImageReshapeMixin:
 
         :seealso: :meth:`Hstack` :meth:`Tile`
         """
-        height = (len(images) - 1) * sep
         width = 0
         colororder = None
         for image in images:
-            height += image.shape[0]
             if image.shape[1] > width:
                 width = image.shape[1]
             if image.iscolor:
@@ -379,19 +321,27 @@ class ImageReshapeMixin:
                 bgcolor = [
                     0,
                 ] * len(colororder)
-        canvas = cls.Constant(width, height, bgcolor, dtype=images[0].dtype)
-        # if colororder is not None:
-        #     canvas = canvas.colorize(colororder=colororder)
-
-        height = 0
-        v = []
-        for image in images:
-            v.append(height)
+        # vertical offset of each image, by cumulative sum of heights plus
+        # separators
+        offsets = np.cumsum([0] + [image.shape[0] + sep for image in images])
+
+        # the canvas is allocated once, with the dtype and planes of the
+        # input images, so the copies below involve no dtype conversion
+        canvas = cls.Constant(width, offsets[-1] - sep, bgcolor, dtype=images[0].dtype)
+        if colororder is None and canvas.iscolor:
+            # a string or 3-vector bgcolor promotes the canvas to color, even
+            # if every input image is greyscale; colorize the inputs to match
+            colororder = canvas.colororder
+
+        # copy each image into the canvas by slice assignment, one contiguous
+        # block copy per image
+        A = canvas.A
+        for image, v in zip(images, offsets[:-1]):
             if colororder is not None and not image.iscolor:
                 image = image.colorize(colororder=colororder)
-            canvas.paste(image, (0, height))
-            height += image.shape[0] + sep
+            A[v : v + image.shape[0], : image.shape[1], ...] = image.image
 
+        v = offsets[:-1].tolist()
         if return_offsets:
             return cls(canvas, colororder=colororder), v
         else:
@@ -453,29 +403,45 @@ class ImageReshapeMixin:
                 bgcolor = [
                     0,
                 ] * len(colororder)
-        canvas = cls.Constant(
-            columns * shape[1] + (columns - 1) * sep,
-            nrows * shape[0] + (nrows - 1) * sep,
-            bgcolor,
-            dtype=tiles[0].dtype,
-        )
-        if len(shape) == 3:
-            canvas = canvas.colorize(colororder=colororder)
-
-        v = 0
-        iterator = iter(tiles)
-        try:
-            while True:
-                u = 0  # start new column
-                for c in range(columns):
-                    # for each column
-                    im = next(iterator)
-                    canvas.paste(im, (u, v), "set", "topleft")
-                    u += shape[1] + sep
-                v += shape[0] + sep
-        except StopIteration:
-            # ran out of images
-            pass
+        canvas_width = columns * shape[1] + (columns - 1) * sep
+        canvas_height = nrows * shape[0] + (nrows - 1) * sep
+        if isinstance(bgcolor, str):
+            # background given as a colorname
+            bgcolor = name2color(bgcolor, dtype=tiles[0].dtype)
+        if colororder is None and np.asarray(bgcolor).size == 3:
+            # a color background behind greyscale tiles, assume RGB as
+            # Constant does
+            colororder = "RGB"
+
+        # allocate the canvas directly at its final shape, on a cache-line
+        # boundary so that the tile copies below, and later strided passes
+        # over the canvas, start from aligned rows
+        if colororder is not None:
+            nplanes = shape[2] if len(shape) == 3 else 3
+            canvas = cls(
+                _aligned_full(
+                    (canvas_height, canvas_width, nplanes), bgcolor, tiles[0].dtype
+                ),
+                colororder=colororder,
+            )
+        else:
+            canvas = cls(
+                _aligned_full((canvas_height, canvas_width), bgcolor, tiles[0].dtype)
+            )
+
+        # all tiles are the same size, so paste by direct slice assignment
+        # into the canvas array: one contiguous block copy per tile
+        C = canvas.A
+        th, tw = shape[:2]
+        for i, tile in enumerate(tiles):
+            r, c = divmod(i, columns)
+            v = r * (th + sep)
+            u = c * (tw + sep)
+            timg = tile.image
+            if canvas.iscolor and timg.ndim == 2:
+                # greyscale tile into a color canvas, replicate across planes
+                timg = timg[..., np.newaxis]
+            C[v : v + th, u : u + tw, ...] = timg
 
         return canvas
 
@@ -635,12 +601,11 @@ class ImageReshapeMixin:
         left, right, top, bot = roi
         if left >= right or top >= bot:
             raise ValueError("ROI should be top-left and bottom-right corners")
-        # TODO check row/column ordering, and ndim check
+        # TODO check row/column ordering
 
-        if self.ndim > 2:
-            roi = self.image[top : bot + 1, left : right + 1, :]
-        else:
-            roi = self.image[top : bot + 1, left : right + 1]
+        # one strided view covering any number of trailing plane dimensions,
+        # no pixel data is copied
+        roi = self.image[top : bot + 1, left : right + 1, ...]
 
         if bbox is None:
             return self.__class__(roi, colororder=self.colororder), [
@@ -697,24 +662,19 @@ class ImageReshapeMixin:
         sc = np.r_[image2.shape[:2]] / np.r_[im.shape[:2]]
         o = self.scale(sc.max())
 
-        if o.height > image2.width:  # rows then columns
-            # scaled image is too high, so trim rows
-            d = o.height - image2.height
-            d1 = max(1, int(np.floor(d * bias)))
-            d2 = d - d1
-            # [1 d d1 d2]
-            o = o.image[d1:-d2, :, :]  # TODO check indexing
-        if o.width > image2.width:
-            # scaled image is too wide, so trim columns
-            d = o.width - image2.width
-            d1 = max(1, int(np.floor(d * bias)))
-            d2 = d - d1
-            # [2 d d1 d2]
-            out = o.image[:, d1:-d2, :]  # TODO check indexing
+        # scaling by the larger factor matches one dimension and overshoots
+        # the other, so trim the excess rows and columns.  bias splits the
+        # excess between top/bottom and left/right.  Both crops are fused
+        # into a single slice, one view instead of two intermediate copies.
+        dy = max(o.height - image2.height, 0)
+        dx = max(o.width - image2.width, 0)
+        dy1 = int(np.floor(dy * bias))
+        dx1 = int(np.floor(dx * bias))
+        out = o.image[dy1 : dy1 + image2.height, dx1 : dx1 + image2.width, ...]
 
         return self.__class__(out, colororder=self.colororder)
 
-    def scale(self, sfactor, sigma=None, interpolation=None):
+    def scale(self, sfactor, sigma=None, interpolation=None, device="cpu"):
         """
         Scale an image
 
@@ -722,8 +682,12 @@ class ImageReshapeMixin:
         :type sfactor: scalar
         :param sigma: standard deviation of kernel for image smoothing, in pixels
         :type sigma: float
+        :param device: compute device, one of ``'cpu'`` [default], ``'gpu'``
+            (CuPy) or ``'cuda'`` (OpenCV CUDA)
+        :type device: str, optional
         :raises ValueError: bad interpolation string
         :raises ValueError: bad interpolation value
+        :raises ValueError: bad device string
         :return: smoothed image
         :rtype: :class:`Image` instance
 
@@ -732,6 +696,16 @@ class ImageReshapeMixin:
         If ``sfactor < 1`` the image is made smaller and smoothing can be
         applied to reduce sampling artefacts. If ``sigma`` is None, use default
         for scale by sigma=1/sfactor/2. If ``sigma=0`` perform no smoothing.
+        For the default smoothing and interpolation the downscale is performed
+        in a single pass using area interpolation, which integrates over the
+        source pixel area and so provides the anti-aliasing directly.
+
+        If ``device='gpu'`` the smoothing and interpolation are performed on
+        the GPU using CuPy, which requires CuPy to be installed.  If
+        ``device='cuda'`` the resize is performed by OpenCV's CUDA module,
+        which requires OpenCV to be built with CUDA support.  If the
+        requested backend is not available the computation falls back to
+        OpenCV on the CPU.
 
         =============  ====================================
         interpolation  description
@@ -759,37 +733,141 @@ class ImageReshapeMixin:
         if not smb.isscalar(sfactor):
             raise TypeError(sfactor, "factor is not a scalar")
 
+        if device not in ("cpu", "gpu", "cuda"):
+            raise ValueError("bad device string")
+
+        default_interp = interpolation is None
         if interpolation is None:
-            if sfactor > 1:
-                interpolation = cv.INTER_CUBIC
-            else:
-                interpolation = cv.INTER_CUBIC
-        elif isinstance(interpolation, str):
-            if interpolation == "cubic":
-                interpolation = cv.INTER_CUBIC
-            elif interpolation == "linear":
-                interpolation = cv.INTER_LINEAR
-            elif interpolation == "area":
-                interpolation = cv.INTER_AREA
-            else:
-                raise ValueError("bad interpolation string")
-        else:
+            interpolation = "cubic"
+        elif not isinstance(interpolation, str):
             raise TypeError("bad interpolation value")
 
-        if sfactor < 1:
-            if sigma is None:
-                sigma = 1 / sfactor / 2
-            if sigma > 0:
+        if interpolation == "cubic":
+            flags = cv.INTER_CUBIC
+        elif interpolation == "linear":
+            flags = cv.INTER_LINEAR
+        elif interpolation == "area":
+            flags = cv.INTER_AREA
+        else:
+            raise ValueError("bad interpolation string")
+
+        if sfactor < 1 and sigma is None:
+            sigma = 1 / sfactor / 2
+
+        # for a default downscale, INTER_AREA integrates over the source
+        # pixel area which provides the anti-aliasing that the Gaussian
+        # pre-smooth otherwise adds, in a single pass over the image rather
+        # than two.  Only fall back to the two-pass path when the user asks
+        # for a larger custom sigma or a specific interpolation mode.
+        fused = default_interp and sfactor < 1 and 0 < sigma <= 0.5 / sfactor
+        if fused:
+            flags = cv.INTER_AREA
+
+        if device == "cuda":
+            if not _cuda_available():
+                warnings.warn(
+                    "OpenCV has no CUDA device for device='cuda', falling back to CPU"
+                )
+                device = "cpu"
+        elif device == "gpu":
+            try:
+                import cupy as cp
+                import cupyx.scipy.ndimage as cp_ndimage
+            except ImportError:
+                warnings.warn("CuPy is required for device='gpu', falling back to CPU")
+                device = "cpu"
+
+        if device == "cuda":
+            # OpenCV CUDA path, resize on the GPU
+            if sfactor < 1 and sigma > 0 and not fused:
                 im = self.smooth(sigma)
+            else:
+                im = self
+            gpu = cv.cuda_GpuMat()
+            gpu.upload(im.image.astype(self.image.dtype, copy=False))
+            gpu = cv.cuda.resize(
+                gpu, (0, 0), fx=sfactor, fy=sfactor, interpolation=flags
+            )
+            out = gpu.download()
+        elif device == "gpu":
+            # GPU path, smooth and zoom with CuPy
+            order = {"cubic": 3, "linear": 1, "area": 1}[interpolation]
+            d = cp.asarray(self.image)
+            if sfactor < 1 and sigma > 0:
+                # don't smooth across color planes
+                d = cp_ndimage.gaussian_filter(d, (sigma, sigma) + (0,) * (d.ndim - 2))
+            zoom = (sfactor, sfactor) + (1,) * (d.ndim - 2)
+            out = cp.asnumpy(cp_ndimage.zoom(d, zoom, order=order))
         else:
-            im = self
-        out = cv.resize(
-            im.image, None, fx=sfactor, fy=sfactor, interpolation=interpolation
-        )
+            if sfactor < 1 and sigma > 0 and not fused:
+                im = self.smooth(sigma)
+            else:
+                im = self
+            # resize at the original dtype: if the smoothing stage left a
+            # float intermediate, casting back lets cv.resize dispatch its
+            # integer SIMD kernels with an 8x smaller working set for uint8.
+            # astype is a no-op view when the dtype already matches.
+            src = im.image.astype(self.image.dtype, copy=False)
+            out = cv.resize(src, None, fx=sfactor, fy=sfactor, interpolation=flags)
 
         return self.__class__(out, colororder=self.colororder)
 
-    def rotate(self, angle, centre=None):
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def Resizer(cls, sfactor, interpolation=None):
+        """
+        Create a reusable image rescaling function
+
+        :param sfactor: scale factor
+        :type sfactor: scalar
+        :param interpolation: interpolation mode, see :meth:`scale`, defaults
+            to None
+        :type interpolation: str, optional
+        :raises ValueError: bad interpolation string
+        :return: function that rescales an image
+        :rtype: callable
+
+        Returns a function that rescales a passed :class:`Image` by
+        ``sfactor``, equivalent to :meth:`scale` with default smoothing, but
+        with the argument checking and interpolation lookup hoisted out of
+        the per-frame path.  Useful in pipelines that rescale many frames by
+        the same factor.  The returned function is memoized on
+        ``(sfactor, interpolation)``.
+
+        If ``interpolation`` is None the default policy of :meth:`scale` is
+        applied: anti-aliased area interpolation for a downscale, cubic
+        otherwise.  If an interpolation mode is given it is used as is, with
+        no pre-smoothing.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> from machinevisiontoolbox import Image
+            >>> halve = Image.Resizer(0.5, 'linear')
+            >>> halve(Image.Read('monalisa.png'))
+
+        :seealso: :meth:`scale`
+        """
+        if interpolation is None:
+            # same default policy as scale(): area interpolation for a
+            # downscale, which provides the anti-aliasing, otherwise cubic
+            flags = cv.INTER_AREA if sfactor < 1 else cv.INTER_CUBIC
+        else:
+            try:
+                flags = _interp_dict[interpolation]
+            except KeyError:
+                raise ValueError("bad interpolation string")
+
+        def resizer(image):
+            out = cv.resize(
+                image.image, None, fx=sfactor, fy=sfactor, interpolation=flags
+            )
+            return image.__class__(out, colororder=image.colororder)
+
+        return resizer
+
+    def rotate(self, angle, centre=None, bgcolor=0, device="cpu"):
         """
         Rotate an image
 
@@ -797,10 +875,16 @@ class ImageReshapeMixin:
         :type angle: scalar
         :param centre: centre of rotation, defaults to centre of image
         :type centre: array_like(2)
+        :param bgcolor: background color for undefined pixels, defaults to 0
+        :type bgcolor: scalar, optional
+        :param device: compute device, either ``'cpu'`` [default] or ``'cuda'``
+        :type device: str, optional
         :return: rotated image
         :rtype: :class:`Image`
 
         Rotate the image counter-clockwise by angle ``angle`` in radians.
+        Pixels in the output image that do not map to pixels in the input
+        image, eg. in the corners, are set to ``bgcolor``.
 
         Example:
 
@@ -815,16 +899,15 @@ class ImageReshapeMixin:
             - Rotation is defined with respect to a z-axis which is into the
               image, therefore counter-clockwise is a positive angle.
             - The pixels in the corners of the resulting image will be
-              undefined.
+              set to ``bgcolor``.
 
         """
-        # TODO note that there is cv.getRotationMatrix2D and cv.warpAffine
-        # https://appdividend.com/2020/09/24/how-to-rotate-an-image-in-python-
-        # using-opencv/
-
         if not smb.isscalar(angle):
             raise ValueError(angle, "angle is not a valid scalar")
 
+        if device not in ("cpu", "cuda"):
+            raise ValueError("bad device string")
+
         # TODO check optional inputs
 
         if centre is None:
@@ -834,9 +917,39 @@ class ImageReshapeMixin:
 
         shape = (self.width, self.height)
 
-        M = cv.getRotationMatrix2D(centre, np.degrees(angle), 1.0)
+        M = _rotation_matrix(np.degrees(angle), float(centre[0]), float(centre[1]))
+
+        bordervalue = [
+            bgcolor,
+        ] * self.nplanes
 
-        out = cv.warpAffine(self.A, M, shape)
+        if device == "cuda" and not _cuda_available():
+            warnings.warn(
+                "OpenCV has no CUDA device for device='cuda', falling back to CPU"
+            )
+            device = "cpu"
+
+        if device == "cuda":
+            gpu = cv.cuda_GpuMat()
+            gpu.upload(self.A)
+            gpu = cv.cuda.warpAffine(
+                gpu,
+                M,
+                shape,
+                flags=cv.INTER_LINEAR,
+                borderMode=cv.BORDER_CONSTANT,
+                borderValue=bordervalue,
+            )
+            out = gpu.download()
+        else:
+            out = cv.warpAffine(
+                self.A,
+                M,
+                shape,
+                flags=cv.INTER_LINEAR,
+                borderMode=cv.BORDER_CONSTANT,
+                borderValue=bordervalue,
+            )
         return self.__class__(out, colororder=self.colororder)
 
     def rotate_spherical(self, R):
@@ -993,7 +1106,7 @@ class ImageReshapeMixin:
         return self.__class__(Zi.reshape(U.shape), **kwargs)
 
     # TODO, this should be warp_affine
-    def warp_affine(self, M, inverse=False, size=None, bgcolor=None):
+    def warp_affine(self, M, inverse=False, size=None, bgcolor=None, device="cpu"):
         r"""
         Affine warp of image
 
@@ -1005,6 +1118,8 @@ class ImageReshapeMixin:
         :type size: array_like(2), optional
         :param bgcolor: background color, defaults to None
         :type bgcolor: scalar, str, array_like, optional
+        :param device: compute device, either ``'cpu'`` [default] or ``'cuda'``
+        :type device: str, optional
         :return: warped image
         :rtype: :class:`Image`
 
@@ -1030,6 +1145,9 @@ class ImageReshapeMixin:
 
         :seealso: :meth:`warp` `opencv.warpAffine <https://docs.opencv.org/3.4/da/d54/group__imgproc__transform.html#ga0203d9ee5fcd28d40dbc4a1ea4451983>`_
         """
+        if device not in ("cpu", "cuda"):
+            raise ValueError("bad device string")
+
         flags = cv.INTER_CUBIC
         if inverse:
             flags |= cv.WARP_INVERSE_MAP
@@ -1050,16 +1168,104 @@ class ImageReshapeMixin:
 
         if isinstance(M, SE2):
             M = M.A
-        out = cv.warpAffine(
-            src=self.image,
-            M=M[:2, :],
-            dsize=size,
-            flags=flags,
-            borderMode=bordermode,
-            borderValue=bordervalue,
-        )
+
+        if device == "cuda" and not _cuda_available():
+            warnings.warn(
+                "OpenCV has no CUDA device for device='cuda', falling back to CPU"
+            )
+            device = "cpu"
+
+        if device == "cuda":
+            # warp on the GPU, the result is downloaded back to host memory
+            gpu = cv.cuda_GpuMat()
+            gpu.upload(self.image)
+            gpu = cv.cuda.warpAffine(
+                gpu,
+                M[:2, :],
+                size,
+                flags=flags,
+                borderMode=bordermode,
+                borderValue=bordervalue,
+            )
+            out = gpu.download()
+        else:
+            out = cv.warpAffine(
+                src=self.image,
+                M=M[:2, :],
+                dsize=size,
+                flags=flags,
+                borderMode=bordermode,
+                borderValue=bordervalue,
+            )
         return self.__class__(out, colororder=self.colororder)
 
+    @classmethod
+    def warp_stack(cls, images, M, inverse=False, size=None, bgcolor=None):
+        r"""
+        Affine warp of an image stack
+
+        :param images: images to warp
+        :type images: iterable of :class:`Image`
+        :param M: affine matrix
+        :type M: ndarray(2,3), SE2
+        :param inverse: warp with inverse of ``M``, defaults to False
+        :type inverse: bool, optional
+        :param size: size of output images, defaults to size of first input image
+        :type size: array_like(2), optional
+        :param bgcolor: background color, defaults to None
+        :type bgcolor: scalar, str, array_like, optional
+        :return: warped images
+        :rtype: list of :class:`Image`
+
+        Apply the same affine warp to every image in the stack, for example
+        every frame of a video sequence.  The warp matrix and output buffer
+        are set up once, and each frame is warped into a slice of a
+        preallocated output array, which is cheaper than calling
+        :meth:`warp_affine` per frame.
+
+        All images must have the same shape and dtype.
+
+        :seealso: :meth:`warp_affine` `opencv.warpAffine <https://docs.opencv.org/3.4/da/d54/group__imgproc__transform.html#ga0203d9ee5fcd28d40dbc4a1ea4451983>`_
+        """
+        flags = cv.INTER_CUBIC
+        if inverse:
+            flags |= cv.WARP_INVERSE_MAP
+
+        first = images[0]
+        if size is None:
+            size = first.size
+
+        if bgcolor is not None:
+            bordermode = cv.BORDER_CONSTANT
+            bordervalue = [
+                bgcolor,
+            ] * first.nplanes
+        else:
+            bordermode = None
+            bordervalue = None
+
+        if isinstance(M, SE2):
+            M = M.A
+        M = M[:2, :]
+
+        stack = np.ascontiguousarray(np.stack([image.image for image in images]))
+        out = np.empty(
+            (stack.shape[0], size[1], size[0]) + stack.shape[3:], dtype=stack.dtype
+        )
+        for i in range(stack.shape[0]):
+            cv.warpAffine(
+                src=stack[i],
+                M=M,
+                dsize=size,
+                dst=out[i],
+                flags=flags,
+                borderMode=bordermode,
+                borderValue=bordervalue,
+            )
+        return [
+            cls(out[i], colororder=first.colororder) for i in range(out.shape[0])
+        ]
+
     def warp_perspective(
         self, H, method="linear", inverse=False, tile=False, size=None
     ):
@@ -1195,64 +1401,74 @@ class ImageReshapeMixin:
         elif image.ndim == 3:
             return image.reshape((-1, self.nplanes))
 
-    # def col2im(col, im):
-    #     """
-    #     Convert pixel vector to image
-
-    #     :param col: set of pixel values
-    #     :type col: numpy array, shape (N, P)
-    #     :param im: image
-    #     :type im: numpy array, shape (N, M, P), or a 2-vector (N, M)
-    #     indicating image size
-    #     :return: image of specified shape
-    #     :rtype: numpy array
-
-    #     - ``col2im(col, imsize)`` is an image (H, W, P) comprising the pixel
-    #         values in col (N,P) with one row per pixel where N=HxW. ``imsize`` is
-    #         a 2-vector (N,M).
-
-    #     - ``col2im(col, im)`` as above but the dimensions of the return are the
-    #         same as ``im``.
-
-    #     .. note::
-
-    #         - The number of rows in ``col`` must match the product of the
-    #             elements of ``imsize``.
-
-    #     :references:
-
-    #         - Robotics, Vision & Control, Chapter 10, P. Corke, Springer 2011.
-    #     """
-
-    #     # col = argcheck.getvector(col)
-    #     col = np.array(col)
-    #     if col.ndim == 1:
-    #         nc = 1
-    #     elif col.ndim == 2:
-    #         nc = col.shape[1]
-    #     else:
-    #         raise ValueError(col, 'col does not have valid shape')
-
-    #     # second input can be either a 2-tuple/2-array, or a full image
-    #     im = np.array(im)  # ensure we can use ndim and shape
-    #     if im.ndim == 1:
-    #         # input is a tuple/1D array
-    #         sz = im
-    #     elif im.ndim == 2:
-    #         im = Image.getimage(im)
-    #         sz = im.shape
-    #     elif im.ndim == 3:
-    #         im = Image.getimage(im)
-    #         sz = np.array([im.shape[0], im.shape[1]])  # ignore 3rd channel
-    #     else:
-    #         raise ValueError(im, 'im does not have valid shape')
-
-    #     if nc > 1:
-    #         sz = np.hstack((sz, nc))
-
-    #     # reshape:
-    #     # TODO need to test this
-    #     return np.reshape(col, sz)
+    @classmethod
+    def col2im(cls, col, im):
+        """
+        Convert pixel vector to image
+
+        :param col: set of pixel values
+        :type col: ndarray(N) or ndarray(N,P)
+        :param im: image, or its dimensions (width, height)
+        :type im: :class:`Image`, ndarray(H,W), ndarray(H,W,P), array_like(2)
+        :raises ValueError: ``col`` does not have valid shape
+        :raises ValueError: ``im`` does not have valid shape
+        :return: image of specified shape
+        :rtype: :class:`Image`
+
+        Convert a set of pixel values, one row per pixel, into an image.  The
+        spatial dimensions are taken from ``im`` which is either an image or
+        the dimensions ``(width, height)``, and :math:`N = H \\times W`.  The
+        pixels are laid out in row-major (C) order, the inverse of
+        :meth:`view1d`.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> from machinevisiontoolbox import Image
+            >>> img = Image.Read('monalisa.png')
+            >>> col = img.view1d()
+            >>> col.shape
+            >>> Image.col2im(col, img)
+
+        :references:
+            - Robotics, Vision & Control, Chapter 10, P. Corke, Springer 2011.
+
+        :seealso: :meth:`view1d`
+        """
+        col = np.asarray(col)  # no copy if already an ndarray
+        if col.ndim == 1:
+            nc = 1
+        elif col.ndim == 2:
+            nc = col.shape[1]
+        else:
+            raise ValueError(col, "col does not have valid shape")
+
+        # second input can be either dimensions (width, height), or a full
+        # image whose dimensions, and color order, are borrowed
+        colororder = None
+        if isinstance(im, cls):
+            colororder = im.colororder
+            im = im.image
+        if isinstance(im, (tuple, list)) and len(im) == 2:
+            # dimensions given as (width, height), no need to involve NumPy
+            sz = (im[1], im[0])
+        else:
+            im = np.asarray(im)  # view only, the pixel values are never read
+            if im.ndim == 1:
+                # dimensions given as (width, height)
+                sz = im[::-1]
+            elif im.ndim in (2, 3):
+                sz = np.array(im.shape[:2])  # ignore the planes of a color image
+            else:
+                raise ValueError(im, "im does not have valid shape")
+
+        sz = (*sz, nc) if nc > 1 else tuple(sz)
+
+        if nc > 1 and colororder is not None and len(colororder) == nc:
+            return cls(col.reshape(sz), colororder=colororder)
+        else:
+            return cls(col.reshape(sz))
 
 
 if __name__ == "__main__":
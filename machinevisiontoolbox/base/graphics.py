@@ -147,50 +147,34 @@ def draw_box(
                 h = wh
         if centre is not None:
             cx, cy = centre
+        else:
+            cx = cy = None
 
+        # derive missing sides from whichever of the other parameters were
+        # given, explicit tests rather than try/except arithmetic on None
         if l is None:
-            try:
+            if r is not None and w is not None:
                 l = r - w
-            except:
-                pass
-        if l is None:
-            try:
+            elif cx is not None and w is not None:
                 l = cx - w / 2
-            except:
-                pass
 
         if r is None:
-            try:
+            if l is not None and w is not None:
                 r = l + w
-            except:
-                pass
-        if r is None:
-            try:
+            elif cx is not None and w is not None:
                 r = cx + w / 2
-            except:
-                pass
 
         if t is None:
-            try:
+            if b is not None and h is not None:
                 t = b + h
-            except:
-                pass
-        if t is None:
-            try:
+            elif cy is not None and h is not None:
                 t = cy + h / 2
-            except:
-                pass
 
         if b is None:
-            try:
+            if t is not None and h is not None:
                 b = t - h
-            except:
-                pass
-        if b is None:
-            try:
+            elif cy is not None and h is not None:
                 b = cy - h / 2
-            except:
-                pass
 
     if l >= r:
         raise ValueError("left must be less than right")
@@ -198,9 +182,8 @@ def draw_box(
         # raise ValueError("bottom must be less than top")
         b, t = t, b
 
-    # TODO need to do this?
-    bl = tuple([int(x) for x in (l, b)])
-    tr = tuple([int(x) for x in (r, t)])
+    bl = (int(l), int(b))
+    tr = (int(r), int(t))
 
     if isinstance(color, str):
         color = color_bgr(color)
@@ -459,6 +442,17 @@ def draw_text(
     return image
 
 
+# marker characters that can be drawn with cv.drawMarker rather than
+# rasterized as a font glyph by cv.putText
+_markerdict = {
+    "x": cv.MARKER_TILTED_CROSS,
+    "*": cv.MARKER_STAR,
+    "d": cv.MARKER_DIAMOND,
+    "^": cv.MARKER_TRIANGLE_UP,
+    "v": cv.MARKER_TRIANGLE_DOWN,
+}
+
+
 def draw_point(
     image,
     pos,
@@ -563,15 +557,15 @@ def draw_point(
         raise TypeError("can't draw color into a greyscale image")
 
     if isinstance(pos, np.ndarray) and pos.shape[0] == 2:
-        x = pos[0, :]
-        y = pos[1, :]
+        # points as a 2xN array, one column per point
+        P = pos.T
     elif isinstance(pos, (tuple, list)):
         if smb.islistof(pos, (tuple, list)):
-            x = [z[0] for z in pos]
-            y = [z[1] for z in pos]
+            P = pos
         else:
-            x = [pos[0]]
-            y = [pos[1]]
+            P = [pos]
+    # points as an Nx2 array, one row per point
+    P = np.asarray(P, dtype=np.int32).reshape(-1, 2)
 
     newmarker = ""
     markercolor = ""
@@ -587,7 +581,45 @@ def draw_point(
     if isinstance(color, str):
         color = color_bgr(color)[::-1]
 
-    for i, xy in enumerate(zip(x, y)):
+    if marker == "+":
+        # draw all the crosses with two batch polylines calls, one for the
+        # horizontal strokes and one for the vertical strokes, rather than
+        # one call per point
+        r = max(2, round(10 * fontsize))
+        h_lines = np.stack([P + [-r, 0], P + [r, 0]], axis=1)
+        v_lines = np.stack([P + [0, -r], P + [0, r]], axis=1)
+        cv.polylines(image, h_lines, False, color, fontthickness)
+        cv.polylines(image, v_lines, False, color, fontthickness)
+        marker = ""
+        if text is None:
+            return image
+    elif marker == "o":
+        # OpenCV has no circle marker type, draw with cv.circle
+        r = max(2, round(10 * fontsize))
+        for xy in P:
+            cv.circle(image, tuple(xy), r, color, fontthickness)
+        marker = ""
+        if text is None:
+            return image
+    elif marker in _markerdict:
+        # line-drawing markers are much cheaper than rasterizing a font
+        # glyph with putText
+        markertype = _markerdict[marker]
+        markersize = max(4, round(20 * fontsize))
+        for xy in P:
+            cv.drawMarker(
+                image,
+                tuple(xy),
+                color,
+                markerType=markertype,
+                markerSize=markersize,
+                thickness=fontthickness,
+            )
+        marker = ""
+        if text is None:
+            return image
+
+    for i, xy in enumerate(P):
         if isinstance(text, str):
             label = text.format(i)
         elif isinstance(text, Iterable):
@@ -595,11 +627,10 @@ def draw_point(
         else:
             label = ""
 
-        xy = [int(_) for _ in xy]
         cv.putText(
             image,
             f"{marker} {label}",
-            xy,
+            tuple(xy),
             fontdict[font],
             fontsize,
             color,
@@ -318,6 +318,98 @@ class TestImageProcessingBase(unittest.TestCase):
         nt.assert_almost_equal(x.A[:,:,1], 3 * im[:,:,1])
         nt.assert_almost_equal(x.A[:,:,2], 256 - im[:,:,2])
 
+    def test_samesize(self):
+
+        im = Image(np.random.randint(0, 255, (100, 100), np.uint8))
+
+        # target is wider than high, rows are trimmed
+        out = im.samesize(Image.Zeros(60, 30))
+        self.assertEqual(out.shape, (30, 60))
+
+        # target is higher than wide, columns are trimmed
+        out = im.samesize(Image.Zeros(30, 60))
+        self.assertEqual(out.shape, (60, 30))
+
+        # target is the same size, nothing is trimmed
+        out = im.samesize(Image.Zeros(100, 100))
+        self.assertEqual(out.shape, (100, 100))
+
+        # bias controls which rows are kept: top half is 0, bottom half is 1
+        im = Image(np.vstack([np.zeros((50, 100)), np.ones((50, 100))]).astype(np.uint8))
+        out = im.samesize(Image.Zeros(100, 50), bias=0)
+        nt.assert_array_equal(out.image, 0)
+        out = im.samesize(Image.Zeros(100, 50), bias=1)
+        nt.assert_array_equal(out.image, 1)
+
+        # color image, colororder is preserved
+        im = Image(np.random.randint(0, 255, (100, 100, 3), np.uint8), colororder="RGB")
+        out = im.samesize(Image.Zeros(60, 30))
+        self.assertEqual(out.shape, (30, 60, 3))
+        self.assertEqual(out.colororder_str, "R:G:B")
+
+    def test_hstack(self):
+
+        # greyscale images with a colorname background give a color composite
+        imgs = [Image.Constant(3, 2, value=7, dtype='uint8'),
+                Image.Constant(4, 2, value=8, dtype='uint8')]
+        out = Image.Hstack(imgs, bgcolor='red')
+        self.assertEqual(out.shape, (2, 8, 3))
+        self.assertEqual(out.colororder_str, "R:G:B")
+        nt.assert_array_equal(out.image[0, 0, :], [7, 7, 7])
+        nt.assert_array_equal(out.image[0, 3, :], [255, 0, 0])  # separator
+        nt.assert_array_equal(out.image[0, 4, :], [8, 8, 8])
+
+        out, u = Image.Hstack(imgs, bgcolor='red', return_offsets=True)
+        self.assertEqual(u, [0, 4])
+
+    def test_vstack(self):
+
+        # greyscale images with a colorname background give a color composite
+        imgs = [Image.Constant(2, 3, value=7, dtype='uint8'),
+                Image.Constant(2, 4, value=8, dtype='uint8')]
+        out = Image.Vstack(imgs, bgcolor='red')
+        self.assertEqual(out.shape, (8, 2, 3))
+        self.assertEqual(out.colororder_str, "R:G:B")
+        nt.assert_array_equal(out.image[0, 0, :], [7, 7, 7])
+        nt.assert_array_equal(out.image[3, 0, :], [255, 0, 0])  # separator
+        nt.assert_array_equal(out.image[4, 0, :], [8, 8, 8])
+
+        out, v = Image.Vstack(imgs, bgcolor='red', return_offsets=True)
+        self.assertEqual(v, [0, 4])
+
+    def test_tile(self):
+
+        # greyscale tiles
+        tiles = [Image.Constant(3, 2, value=i, dtype='uint8') for i in range(5)]
+        t = Image.Tile(tiles, columns=2, sep=1, bgcolor=9)
+        self.assertEqual(t.shape, (8, 7))
+        nt.assert_array_equal(t.image[:2, :3], 0)
+        nt.assert_array_equal(t.image[:2, 4:], 1)
+        nt.assert_array_equal(t.image[3:5, :3], 2)
+        nt.assert_array_equal(t.image[2, :], 9)       # separator row
+        nt.assert_array_equal(t.image[6:, 4:], 9)     # unused cell
+
+        # color tiles
+        tiles = [
+            Image.Constant(3, 2, value=[i, 0, 255 - i], colororder="RGB")
+            for i in range(4)
+        ]
+        t = Image.Tile(tiles, columns=2, sep=1)
+        self.assertEqual(t.shape, (5, 7, 3))
+        self.assertEqual(t.colororder_str, "R:G:B")
+        nt.assert_array_equal(t.image[0, 0, :], [0, 0, 255])
+        nt.assert_array_equal(t.image[3, 4, :], [3, 0, 252])
+        nt.assert_array_equal(t.image[2, :, :], 0)    # separator row
+
+        # greyscale tiles with a colorname background give a color grid
+        tiles = [Image.Constant(3, 2, value=i, dtype='uint8') for i in range(4)]
+        t = Image.Tile(tiles, columns=2, sep=1, bgcolor='red')
+        self.assertEqual(t.shape, (5, 7, 3))
+        self.assertEqual(t.colororder_str, "R:G:B")
+        nt.assert_array_equal(t.image[0, 0, :], [0, 0, 0])
+        nt.assert_array_equal(t.image[0, 4, :], [1, 1, 1])
+        nt.assert_array_equal(t.image[2, 0, :], [255, 0, 0])  # separator row
+
     # TODO
     # test_stretch
     # test_thresh
@@ -331,7 +423,6 @@ class TestImageProcessingBase(unittest.TestCase):
     # test_testpattern (half done)
     # test_scale
     # test_rotate
-    # test_samesize
     # test_peak2
     # test_roi
 